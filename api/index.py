@@ -1,2 +1,7 @@
 # Expose the Flask app object for Vercel's Python runtime (WSGI)
+import os
+
+# No long-lived connection pool or background threads between invocations
+os.environ.setdefault('DB_PROFILE', 'serverless')
+
 from app import app as app
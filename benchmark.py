@@ -0,0 +1,227 @@
+"""Benchmark the main routes against a synthetic organisation.
+
+Generates employees, supervisors, attendance, leaves, tasks and logs into a
+fresh database, drives the busiest routes through the Flask test client and
+writes latency / queries-per-request / peak-memory figures to a JSON file.
+
+Usage:
+    python benchmark.py --employees 500 --years 2 --output bench.json
+    python benchmark.py --db postgresql://localhost/oms_bench --compare bench.json
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+from datetime import date, datetime, time as dtime, timedelta
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--db', default='sqlite:////tmp/oms_benchmark.db',
+                        help='database URL (default: %(default)s); it is wiped and regenerated')
+    parser.add_argument('--employees', type=int, default=200)
+    parser.add_argument('--supervisors', type=int, default=10)
+    parser.add_argument('--years', type=int, default=1, help='years of attendance and leave history')
+    parser.add_argument('--leaves-per-year', type=int, default=6)
+    parser.add_argument('--tasks', type=int, default=10, help='tasks per employee')
+    parser.add_argument('--logs', type=int, default=50000)
+    parser.add_argument('--requests', type=int, default=20, help='requests per route')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--skip-generate', action='store_true', help='reuse the data already in --db')
+    parser.add_argument('--output', default='bench_results.json')
+    parser.add_argument('--compare', help='previous results JSON to diff against')
+    return parser.parse_args()
+
+
+args = parse_args()
+os.environ['DATABASE_URL'] = args.db
+
+from sqlalchemy import event, insert  # noqa: E402
+from werkzeug.security import generate_password_hash  # noqa: E402
+from app import app, db, User, Attendance, Leave, Task, Log, Holiday, rebuild_attendance_summaries, ensure_user_search  # noqa: E402
+
+BATCH = 5000
+
+
+def bulk_insert(model, rows):
+    for i in range(0, len(rows), BATCH):
+        db.session.execute(insert(model), rows[i:i + BATCH])
+    db.session.commit()
+
+
+def generate(rnd):
+    db.drop_all()
+    db.create_all()
+    ensure_user_search()  # the search triggers went with the old user table
+    password_hash = generate_password_hash('bench', method=app.config['PASSWORD_HASH_METHOD'])  # hashed once, shared by every synthetic user
+    users = [{'username': 'admin', 'password_hash': password_hash, 'full_name': 'Admin', 'role': 'admin'}]
+    for i in range(args.supervisors):
+        users.append({'username': f'sup{i}', 'password_hash': password_hash, 'full_name': f'Supervisor {i}',
+                      'role': 'supervisor', 'department': f'Dept {i % 8}', 'emp_number': f'S{i:05d}'})
+    bulk_insert(User, users)
+    supervisor_ids = [uid for (uid,) in db.session.query(User.id).filter_by(role='supervisor').order_by(User.id)]
+    today = date.today()
+    employees = [{
+        'username': f'emp{i}', 'password_hash': password_hash, 'full_name': f'Employee {i}', 'role': 'employee',
+        'manager_id': supervisor_ids[i % len(supervisor_ids)] if supervisor_ids else None,
+        'department': f'Dept {i % 8}', 'team': rnd.choice(['corporate', 'production']),
+        'emp_number': f'E{i:06d}', 'doj': today - timedelta(days=rnd.randint(90, 365 * (args.years + 2))),
+        'salary': rnd.randint(20, 120) * 1000,
+    } for i in range(args.employees)]
+    bulk_insert(User, employees)
+    employee_ids = [uid for (uid,) in db.session.query(User.id).filter_by(role='employee').order_by(User.id)]
+
+    start = today - timedelta(days=365 * args.years)
+    workdays = [start + timedelta(days=d) for d in range((today - start).days + 1)
+                if (start + timedelta(days=d)).weekday() < 5]
+    bulk_insert(Holiday, [{'date': d, 'name': f'Holiday {n}'} for n, d in enumerate(rnd.sample(workdays, min(10 * args.years, len(workdays))))])
+
+    attendance = []
+    for uid in employee_ids:
+        for day in workdays:
+            if rnd.random() < 0.92:
+                out_hour = rnd.randint(17, 21)
+                attendance.append({'user_id': uid, 'date': day, 'in_time': dtime(9, rnd.randint(0, 59)),
+                                   'out_time': dtime(out_hour, rnd.randint(0, 59)), 'overtime': max(out_hour - 18, 0)})
+        if len(attendance) >= BATCH * 4:
+            bulk_insert(Attendance, attendance)
+            attendance = []
+    bulk_insert(Attendance, attendance)
+
+    leaves = []
+    for uid in employee_ids:
+        for _ in range(args.leaves_per_year * args.years):
+            first = rnd.choice(workdays)
+            leaves.append({'user_id': uid, 'leave_type': rnd.choice(['casual', 'sick', 'earned', 'lop']),
+                           'start_date': first, 'end_date': first + timedelta(days=rnd.randint(0, 2)),
+                           'status': rnd.choice(['approved', 'approved', 'pending', 'rejected']), 'reason': 'benchmark'})
+    bulk_insert(Leave, leaves)
+
+    tasks = [{'title': f'Task {n}', 'assigned_to': uid, 'assigned_by': supervisor_ids[uid % len(supervisor_ids)],
+              'status': rnd.choice(['pending', 'in_progress', 'completed']), 'progress': rnd.randint(0, 100),
+              'due_date': today + timedelta(days=rnd.randint(-30, 30))}
+             for uid in employee_ids for n in range(args.tasks)] if supervisor_ids else []
+    bulk_insert(Task, tasks)
+
+    now = datetime.utcnow()
+    all_ids = employee_ids + supervisor_ids
+    bulk_insert(Log, [{'user_id': rnd.choice(all_ids), 'action': rnd.choice(['Viewed employee dashboard', 'Viewed attendance', 'Logged in']),
+                       'timestamp': now - timedelta(seconds=rnd.randint(0, 86400))} for _ in range(args.logs)])
+    rebuild_attendance_summaries()
+
+
+class QueryCounter:
+    """Counts statements run on the benchmarking thread (not the audit writer)."""
+
+    def __init__(self):
+        self.count = 0
+        self.thread = threading.get_ident()
+
+    def __call__(self, *_):
+        if threading.get_ident() == self.thread:
+            self.count += 1
+
+
+def login(client, username):
+    response = client.post('/login', data={'username': username, 'password': 'bench'})
+    if response.status_code != 302:
+        sys.exit(f'Could not log in as {username}')
+    return client
+
+
+def run_routes(counter):
+    admin = login(app.test_client(), 'admin')
+    supervisor = login(app.test_client(), 'sup0')
+    employee = login(app.test_client(), 'emp0')
+    routes = [
+        ('admin_dashboard', admin, '/admin/dashboard'),
+        ('admin_logs', admin, '/admin/logs'),
+        ('supervisor_dashboard', supervisor, '/supervisor/dashboard'),
+        ('supervisor_team_list', supervisor, '/supervisor/team_list'),
+        ('employee_leave_balances', employee, '/employee/leave_balances'),
+    ]
+    results = {}
+    for name, client, url in routes:
+        latencies, queries = [], []
+        tracemalloc.start()
+        for _ in range(args.requests):
+            counter.count = 0
+            started = time.perf_counter()
+            response = client.get(url)
+            latencies.append((time.perf_counter() - started) * 1000)
+            queries.append(counter.count)
+            if response.status_code != 200:
+                sys.exit(f'{url} returned {response.status_code}')
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        latencies.sort()
+        results[name] = {
+            'p50_ms': round(statistics.median(latencies), 2),
+            'p95_ms': round(latencies[max(int(len(latencies) * 0.95) - 1, 0)], 2),
+            'mean_ms': round(statistics.fmean(latencies), 2),
+            'queries_per_request': round(statistics.fmean(queries), 1),
+            'peak_memory_kb': round(peak / 1024, 1),
+        }
+        print(f'{name:26s} p50 {results[name]["p50_ms"]:8.2f}ms  p95 {results[name]["p95_ms"]:8.2f}ms  '
+              f'queries {results[name]["queries_per_request"]:6.1f}  peak {results[name]["peak_memory_kb"]:9.1f}KB')
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], text=True,
+                                       cwd=os.path.dirname(os.path.abspath(__file__)),
+                                       stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, previous_path):
+    with open(previous_path) as f:
+        previous = json.load(f)['routes']
+    print(f'\nChange vs {previous_path}:')
+    for name, current in results.items():
+        before = previous.get(name)
+        if not before:
+            continue
+        deltas = []
+        for key in ('p50_ms', 'p95_ms', 'queries_per_request', 'peak_memory_kb'):
+            if before.get(key):
+                deltas.append(f'{key} {(current[key] - before[key]) / before[key] * 100:+.1f}%')
+        print(f'{name:26s} ' + '  '.join(deltas))
+
+
+def main():
+    rnd = random.Random(args.seed)
+    with app.app_context():
+        if not args.skip_generate:
+            started = time.perf_counter()
+            generate(rnd)
+            print(f'Generated synthetic org in {time.perf_counter() - started:.1f}s')
+        counter = QueryCounter()
+        event.listen(db.engine, 'before_cursor_execute', counter)
+        backend = db.engine.url.get_backend_name()
+    # Requests must run outside this app context, otherwise they share its `g` (and current_user)
+    results = run_routes(counter)
+    output = {
+        'commit': git_commit(),
+        'timestamp': datetime.utcnow().isoformat(),
+        'database': backend,
+        'config': {k: v for k, v in vars(args).items() if k not in ('db', 'output', 'compare')},
+        'routes': results,
+    }
+    with open(args.output, 'w') as f:
+        json.dump(output, f, indent=2)
+    print(f'Results written to {args.output}')
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == '__main__':
+    main()
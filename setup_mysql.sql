@@ -29,7 +29,12 @@ CREATE TABLE IF NOT EXISTS user (
     last_working_day DATE,
     salary FLOAT,
     comment TEXT,
-    FOREIGN KEY (manager_id) REFERENCES user(id) ON DELETE SET NULL
+    FOREIGN KEY (manager_id) REFERENCES user(id) ON DELETE SET NULL,
+    INDEX idx_user_role_username (role, username),
+    INDEX idx_user_department (department),
+    INDEX idx_user_manager (manager_id),
+    INDEX idx_user_full_name (full_name),
+    FULLTEXT INDEX idx_user_search (username, full_name, emp_number)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
 -- Attendance table
@@ -41,7 +46,8 @@ CREATE TABLE IF NOT EXISTS attendance (
     out_time TIME,
     overtime FLOAT DEFAULT 0.0,
     FOREIGN KEY (user_id) REFERENCES user(id) ON DELETE CASCADE,
-    INDEX idx_user_date (user_id, date)
+    INDEX idx_user_date (user_id, date),
+    INDEX idx_attendance_date (date)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
 -- Leave table
@@ -55,7 +61,8 @@ CREATE TABLE IF NOT EXISTS `leave` (
     reason TEXT,
     doctor_cert VARCHAR(200),
     FOREIGN KEY (user_id) REFERENCES user(id) ON DELETE CASCADE,
-    INDEX idx_user_status (user_id, status)
+    INDEX idx_user_status (user_id, status),
+    INDEX idx_leave_status_dates (status, start_date, end_date)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
 -- Holiday table
@@ -71,6 +78,9 @@ CREATE TABLE IF NOT EXISTS document (
     user_id INT NOT NULL,
     file_path VARCHAR(200) NOT NULL,
     name VARCHAR(100),
+    sha256 CHAR(64),
+    size INT,
+    mime_type VARCHAR(100),
     FOREIGN KEY (user_id) REFERENCES user(id) ON DELETE CASCADE
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
@@ -81,8 +91,11 @@ CREATE TABLE IF NOT EXISTS salary_slip (
     month INT NOT NULL,
     year INT NOT NULL,
     file_path VARCHAR(200) NOT NULL,
+    sha256 CHAR(64),
+    size INT,
+    mime_type VARCHAR(100),
     FOREIGN KEY (user_id) REFERENCES user(id) ON DELETE CASCADE,
-    INDEX idx_user_month_year (user_id, month, year)
+    UNIQUE KEY uq_salary_slip_user_month (user_id, year, month)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
 -- Log table
@@ -92,7 +105,8 @@ CREATE TABLE IF NOT EXISTS log (
     action TEXT NOT NULL,
     timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (user_id) REFERENCES user(id) ON DELETE SET NULL,
-    INDEX idx_timestamp (timestamp)
+    INDEX idx_timestamp (timestamp),
+    INDEX idx_log_user_timestamp (user_id, timestamp)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
 -- Task table
@@ -109,7 +123,8 @@ CREATE TABLE IF NOT EXISTS task (
     FOREIGN KEY (assigned_to) REFERENCES user(id) ON DELETE CASCADE,
     FOREIGN KEY (assigned_by) REFERENCES user(id) ON DELETE CASCADE,
     INDEX idx_assigned_to (assigned_to),
-    INDEX idx_status (status)
+    INDEX idx_status (status),
+    INDEX idx_task_assignee_status_due (assigned_to, status, due_date)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
 -- Create default admin user (password: admin123)
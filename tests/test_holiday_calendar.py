@@ -0,0 +1,37 @@
+import random
+from datetime import date, timedelta
+
+from app import HolidayCalendar, weekdays_between
+
+
+def brute_force_working_days(start, end, holidays):
+    days = (start + timedelta(days=i) for i in range((end - start).days + 1))
+    return sum(1 for day in days if day.weekday() < 5 and day not in holidays)
+
+
+def test_weekdays_between_matches_day_by_day_count():
+    start = date(2024, 1, 1)
+    for offset in range(40):
+        for length in range(20):
+            first = start + timedelta(days=offset)
+            last = first + timedelta(days=length)
+            assert weekdays_between(first, last) == brute_force_working_days(first, last, set())
+
+
+def test_working_days_skips_weekends_and_holidays():
+    rnd = random.Random(18)
+    holidays = {date(2024, 1, 1) + timedelta(days=rnd.randrange(730)) for _ in range(40)}
+    calendar = HolidayCalendar([(day, 'Holiday') for day in sorted(holidays)])
+    for _ in range(500):
+        start = date(2024, 1, 1) + timedelta(days=rnd.randrange(700))
+        end = start + timedelta(days=rnd.randrange(60))
+        assert calendar.working_days(start, end) == brute_force_working_days(start, end, holidays)
+
+
+def test_working_days_edge_cases():
+    calendar = HolidayCalendar([(date(2024, 12, 25), 'Christmas'), (date(2024, 12, 28), 'Saturday holiday')])
+    assert calendar.working_days(date(2024, 12, 25), date(2024, 12, 25)) == 0
+    assert calendar.working_days(date(2024, 12, 23), date(2024, 12, 29)) == 4
+    assert calendar.working_days(date(2024, 12, 29), date(2024, 12, 23)) == 0
+    assert calendar.is_holiday(date(2024, 12, 28)) and not calendar.is_working_day(date(2024, 12, 28))
+    assert calendar.between(date(2024, 12, 25), date(2024, 12, 28)) == [date(2024, 12, 25)]
@@ -0,0 +1,39 @@
+import random
+from collections import namedtuple
+from datetime import date, timedelta
+
+from app import IntervalTree
+
+Span = namedtuple('Span', ['id', 'start_date', 'end_date'])
+
+
+def brute_force(spans, start, end):
+    return sorted(span.id for span in spans if span.start_date <= end and span.end_date >= start)
+
+
+def test_overlapping_matches_brute_force():
+    rnd = random.Random(24)
+    base = date(2025, 1, 1)
+    spans = []
+    for i in range(300):
+        start = base + timedelta(days=rnd.randrange(365))
+        spans.append(Span(i, start, start + timedelta(days=rnd.randrange(15))))
+    tree = IntervalTree(spans)
+    assert tree.size == len(spans)
+    for _ in range(500):
+        start = base + timedelta(days=rnd.randrange(-10, 380))
+        end = start + timedelta(days=rnd.randrange(20))
+        assert sorted(span.id for span in tree.overlapping(start, end)) == brute_force(spans, start, end)
+
+
+def test_overlapping_bounds_are_inclusive():
+    tree = IntervalTree([Span(1, date(2025, 3, 3), date(2025, 3, 7)), Span(2, date(2025, 3, 10), date(2025, 3, 10))])
+    assert [s.id for s in tree.overlapping(date(2025, 3, 7), date(2025, 3, 9))] == [1]
+    assert [s.id for s in tree.overlapping(date(2025, 3, 10), date(2025, 3, 10))] == [2]
+    assert tree.overlapping(date(2025, 3, 8), date(2025, 3, 9)) == []
+    assert sorted(s.id for s in tree.overlapping(date(2025, 1, 1), date(2025, 12, 31))) == [1, 2]
+
+
+def test_empty_tree():
+    tree = IntervalTree([])
+    assert tree.size == 0 and tree.overlapping(date(2025, 1, 1), date(2025, 12, 31)) == []
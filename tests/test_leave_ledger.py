@@ -0,0 +1,79 @@
+from datetime import date, timedelta
+
+from app import db, User, Leave, get_leave_balances, load_leave_balances, invalidate_leave_balances
+
+
+def recursive_balance(user, leave_type, year):
+    """The per-type recursive get_leave_balance the ledger replaced (calendar days)."""
+    leaves = Leave.query.filter_by(user_id=user.id, leave_type=leave_type, status='approved').filter(
+        Leave.start_date >= date(year, 1, 1), Leave.start_date <= date(year, 12, 31)).all()
+    used_days = sum((l.end_date - l.start_date).days + 1 for l in leaves)
+    if leave_type == 'casual':
+        return 7 - used_days
+    if leave_type == 'sick':
+        prev_balance = recursive_balance(user, 'sick', year - 1) if year > 2020 else 0
+        carried = min(prev_balance, 30) if prev_balance > 0 else 0
+        return 7 + carried - used_days
+    if leave_type == 'earned':
+        if not user.doj:
+            return 0
+        return min((date.today() - user.doj).days // 20 - used_days, 90)
+    if leave_type == 'maternity':
+        return 84 if user.team == 'corporate' else 0
+    return 0
+
+
+def add_user(username, sick_by_year, **fields):
+    user = User(username=username, full_name=username, role='employee', **fields)
+    user.set_password('x')
+    db.session.add(user)
+    db.session.flush()
+    for year, days in sick_by_year.items():
+        # Monday-to-Friday spans in March (no holidays), so working days equal the old calendar-day count
+        monday = date(year, 3, 1) + timedelta(days=-date(year, 3, 1).weekday() % 7)
+        for week, taken in enumerate(range(0, days, 5)):
+            start = monday + timedelta(weeks=week)
+            db.session.add(Leave(user_id=user.id, leave_type='sick', status='approved', start_date=start,
+                                 end_date=start + timedelta(days=min(days - taken, 5) - 1)))
+    db.session.add(Leave(user_id=user.id, leave_type='casual', status='approved',
+                         start_date=date(2024, 6, 3), end_date=date(2024, 6, 4)))
+    db.session.add(Leave(user_id=user.id, leave_type='sick', status='pending',
+                         start_date=date(2024, 9, 2), end_date=date(2024, 9, 6)))
+    return user
+
+
+def test_ledger_matches_recursive_balances(app):
+    users = [
+        add_user('none', {}, doj=date(2020, 1, 6), team='corporate'),
+        add_user('light', {2020: 2, 2022: 9}, doj=date(2021, 7, 1), team='production'),
+        add_user('heavy', {2021: 10, 2023: 14, 2024: 3}),
+        add_user('capped', {2024: 1}, doj=date(2019, 4, 1), team='corporate'),
+    ]
+    db.session.commit()
+    invalidate_leave_balances()
+    for year in range(2020, date.today().year + 1):
+        ledger = load_leave_balances(users, year)
+        for user in users:
+            for leave_type in ('casual', 'sick', 'earned', 'maternity', 'lop'):
+                assert ledger[user.id][leave_type] == recursive_balance(user, leave_type, year), \
+                    (user.username, year, leave_type)
+
+
+def test_sick_leave_carry_forward_is_capped(app):
+    user = add_user('saver', {})
+    db.session.commit()
+    # 7 a year from 2020 with nothing taken: 7, 14, 21, 28, then capped at 30 carried + 7
+    assert get_leave_balances(user, 2024, fresh=True)['sick'] == 7 + 28
+    assert get_leave_balances(user, 2025, fresh=True)['sick'] == 7 + 30
+
+
+def test_fresh_balances_see_other_workers_writes(app):
+    user = add_user('fresh', {})
+    db.session.commit()
+    assert get_leave_balances(user, 2024)['casual'] == 5
+    # Written on a connection of its own, like another worker: no local table version is bumped
+    with db.engine.begin() as conn:
+        conn.execute(Leave.__table__.insert().values(user_id=user.id, leave_type='casual', status='approved',
+                                                     start_date=date(2024, 7, 1), end_date=date(2024, 7, 3)))
+    assert get_leave_balances(user, 2024)['casual'] == 5
+    assert get_leave_balances(user, 2024, fresh=True)['casual'] == 2
@@ -0,0 +1,95 @@
+from datetime import date
+
+from app import db, User, Leave, decide_leaves
+
+MONDAY = date(2030, 3, 4)
+
+
+def make_user(username, role='employee', manager=None):
+    user = User(username=username, full_name=username.title(), role=role, manager_id=manager.id if manager else None)
+    user.set_password('x')
+    db.session.add(user)
+    db.session.flush()
+    return user
+
+
+def make_leave(user, start_day, days, leave_type='casual'):
+    leave = Leave(user_id=user.id, leave_type=leave_type, status='pending',
+                  start_date=MONDAY.replace(day=start_day), end_date=MONDAY.replace(day=start_day + days - 1))
+    db.session.add(leave)
+    db.session.flush()
+    return leave
+
+
+def org():
+    boss = make_user('boss', 'supervisor')
+    lead = make_user('lead', 'supervisor', boss)
+    mine = make_user('mine', manager=lead)
+    other_lead = make_user('otherlead', 'supervisor')
+    theirs = make_user('theirs', manager=other_lead)
+    return boss, lead, mine, other_lead, theirs
+
+
+def statuses(*leaves):
+    return [db.session.get(Leave, leave.id).status for leave in leaves]
+
+
+def test_decide_leaves_only_touches_own_reports(app):
+    boss, lead, mine, other_lead, theirs = org()
+    own = make_leave(mine, 4, 1)
+    foreign = make_leave(theirs, 4, 1)
+    lead_leave = make_leave(lead, 5, 1)
+    db.session.commit()
+    ids = [own.id, foreign.id, lead_leave.id]
+
+    updated, skipped = decide_leaves(lead.id, ids, 'approved')
+    assert updated == [own.id] and skipped == {}
+    db.session.expire_all()
+    assert statuses(own, foreign, lead_leave) == ['approved', 'pending', 'pending']
+
+    # Indirect reports belong to their own supervisor's queue, not the boss's
+    updated, _ = decide_leaves(boss.id, [foreign.id], 'rejected')
+    assert updated == []
+    updated, _ = decide_leaves(boss.id, [lead_leave.id], 'rejected')
+    assert updated == [lead_leave.id]
+
+
+def test_decide_leaves_ignores_already_decided_leaves(app):
+    _, lead, mine, _, _ = org()
+    leave = make_leave(mine, 4, 1)
+    db.session.commit()
+    assert decide_leaves(lead.id, [leave.id], 'rejected')[0] == [leave.id]
+    assert decide_leaves(lead.id, [leave.id], 'approved')[0] == []
+    db.session.expire_all()
+    assert statuses(leave) == ['rejected']
+
+
+def test_bulk_approval_cannot_overdraw(app):
+    _, lead, mine, _, _ = org()
+    first = make_leave(mine, 4, 5)    # 5 of 7 casual days
+    second = make_leave(mine, 11, 3)  # would leave -1
+    lop = make_leave(mine, 18, 5, 'lop')
+    db.session.commit()
+
+    updated, skipped = decide_leaves(lead.id, [second.id, first.id, lop.id], 'approved')
+    assert sorted(updated) == sorted([first.id, lop.id])
+    assert list(skipped) == [second.id] and '3 casual days requested, 2 left' in skipped[second.id]
+    db.session.expire_all()
+    assert statuses(first, second, lop) == ['approved', 'pending', 'approved']
+
+
+def test_queue_route_scopes_the_update(app):
+    _, lead, mine, _, theirs = org()
+    own = make_leave(mine, 4, 1)
+    foreign = make_leave(theirs, 4, 1)
+    db.session.commit()
+    client = app.test_client()
+    assert client.post('/login', data={'username': 'lead', 'password': 'x'}).status_code == 302
+
+    response = client.post('/supervisor/leaves', data={'action': 'approve', 'leave_ids': [own.id, foreign.id]})
+    assert response.status_code == 302
+    db.session.expire_all()
+    assert statuses(own, foreign) == ['approved', 'pending']
+
+    page = client.get('/supervisor/leaves')
+    assert page.status_code == 200 and b'Theirs' not in page.data
@@ -0,0 +1,82 @@
+import pytest
+
+import app as app_module
+from app import db, User, LocalRateLimitStore
+
+
+def test_store_counts_within_the_window():
+    store = LocalRateLimitStore()
+    for t in (100.0, 101.0, 102.0):
+        store.add('k', t, 10)
+    assert store.count('k', 105.0, 10) == (3, 100.0)
+    assert store.count('k', 110.5, 10) == (2, 101.0)
+    assert store.count('k', 200.0, 10) == (0, None)
+    store.add('k', 300.0, 10)
+    store.reset('k')
+    assert store.count('k', 300.0, 10) == (0, None)
+
+
+def test_store_drops_lapsed_keys_on_add():
+    store = LocalRateLimitStore()
+    for i in range(1000):
+        store.add(f'user{i}', 1000.0 + i, 60)
+    # Only keys seen in the last 60 seconds survive, without ever being read again
+    assert len(store._hits) == 60
+
+
+def test_store_evicts_least_recent_keys_beyond_max_keys():
+    store = LocalRateLimitStore(max_keys=100)
+    store.add('hot', 0.0, 3600)
+    for i in range(1000):
+        store.add(f'ip{i}', 1.0 + i * 0.001, 3600)
+        if i % 50 == 0:
+            store.add('hot', 1.0 + i * 0.001, 3600)
+    assert len(store._hits) == 100
+    assert 'ip999' in store._hits and 'ip0' not in store._hits
+
+
+@pytest.fixture
+def limits(app):
+    saved = {key: app.config[key] for key in ('LOGIN_RATE_LIMIT_IP', 'LOGIN_RATE_LIMIT_USER', 'LOGIN_RATE_WINDOW')}
+    app.config.update(LOGIN_RATE_LIMIT_IP=4, LOGIN_RATE_LIMIT_USER=3, LOGIN_RATE_WINDOW=300)
+    for username in ('alice', 'bob'):
+        user = User(username=username, full_name=username.title(), role='employee')
+        user.set_password('secret')
+        db.session.add(user)
+    db.session.commit()
+    yield app
+    app.config.update(saved)
+
+
+def post_login(client, username, password, ip='10.0.0.1'):
+    return client.post('/login', data={'username': username, 'password': password},
+                       environ_base={'REMOTE_ADDR': ip})
+
+
+def test_username_lockout_skips_the_password_check(limits, monkeypatch):
+    client = limits.test_client()
+    for _ in range(3):
+        assert post_login(client, 'alice', 'wrong').status_code == 200
+    checks = []
+    monkeypatch.setattr(User, 'check_password', lambda self, password: checks.append(password) or True)
+    response = post_login(client, 'Alice', 'secret', ip='10.0.0.2')
+    assert response.status_code == 429 and int(response.headers['Retry-After']) > 0
+    assert checks == []
+
+
+def test_ip_limit_never_blocks_a_correct_password(limits):
+    client = limits.test_client()
+    for i in range(4):
+        post_login(client, f'ghost{i}', 'wrong')
+    assert post_login(client, 'ghost9', 'wrong').status_code == 429
+    assert post_login(client, 'bob', 'wrong').status_code == 429
+    assert post_login(client, 'bob', 'secret').status_code == 302
+    assert post_login(limits.test_client(), 'ghost9', 'wrong', ip='10.0.0.9').status_code == 200
+
+
+def test_successful_login_clears_the_username_count(limits):
+    client = limits.test_client()
+    for _ in range(2):
+        post_login(client, 'alice', 'wrong', ip='10.0.0.3')
+    assert post_login(client, 'alice', 'secret', ip='10.0.0.3').status_code == 302
+    assert app_module.login_limiter.user_retry_after('alice') == 0